@@ -112,6 +112,7 @@ def import_sverchok():
 
 
 imported_modules, node_modules, core = import_sverchok()
+is_gc_frozen = False  # whether the add-on froze garbage collector objects
 
 
 @profiling_startup("reg_stats")
@@ -123,8 +124,25 @@ def register():
     core.sv_register_modules(node_modules)
     ascii_print.show_welcome()
 
+    # objects of Blender and of the add-on modules live till the end of the
+    # session, there is no need to scan them during each garbage collection
+    # if something else already froze objects, it's left as is
+    global is_gc_frozen
+    import gc
+    if not gc.get_freeze_count():
+        gc.collect()  # garbage of the registration should not be frozen
+        gc.freeze()
+        is_gc_frozen = True
+
 
 def unregister():
+    # unfreezing is process-wide, it also unfreezes objects which were frozen
+    # after the add-on registration by Blender or other add-ons
+    global is_gc_frozen
+    if is_gc_frozen:
+        import gc
+        gc.unfreeze()  # the add-on objects can be collected after reloading
+        is_gc_frozen = False
     core.sv_unregister_modules(imported_modules)
     core.sv_unregister_modules(core.imported_utils_modules())
     core.sv_unregister_modules(node_modules)
@@ -123,16 +123,12 @@ class GroupUpdateTree(us.UpdateTree):
     def mark_outdated_groups(cls, gr_tree: 'GrTree'):
         """It searches upstream node groups till main trees which should be
         updated to update given group tree"""
-        nodes_to_update = defaultdict(set)
-        for gr_node in trees_graph.walk(gr_tree):
-            nodes_to_update[gr_node.id_data].add(gr_node)
-
-        for tree, nodes in nodes_to_update.items():
+        for tree, nodes in trees_graph.nodes_to_update(gr_tree).items():
             us.UpdateTree.get(tree).add_outdated(nodes)
             if tree.bl_idname == BlTrees.MAIN_TREE_ID and tree.sv_process:
-                ts.tasks.add(ts.Task(tree,
-                                     us.UpdateTree.main_update(tree),
-                                     is_scene_update=False))
+                ts.tasks.add(tree,
+                             us.UpdateTree.main_update,
+                             is_scene_update=False)
 
     def __init__(self, tree):
         """Should node be used directly but wia the get class method
@@ -173,15 +169,11 @@ class GroupUpdateTree(us.UpdateTree):
             viewers = frozenset(self._viewer_nodes)
             self._outdated_nodes.clear()
             self._viewer_nodes.clear()
+            # nothing to update, also it keeps the sorting cache intact
+            if not outdated:
+                return
 
-        for node, other_socks in self._sort_nodes(outdated, viewers):
-            # execute node only if all previous nodes are updated
-            if all(n.get(us.UPDATE_KEY, True) for sock in other_socks if (n := self._sock_node.get(sock))):
-                yield node, other_socks
-                if node.get(us.ERROR_KEY, False):
-                    self._outdated_nodes.add(node)
-            else:
-                node[us.UPDATE_KEY] = False
+        yield from self._walk_sorted(self._sort_nodes(outdated, viewers))
 
     def _get_input_connected(self):
         if not (group_input := self._active_input()):
@@ -216,17 +208,20 @@ class TreesGraph:
         :_group_main: it stores information about in which main trees a group
         tree is used. The group tree can be located in some nested groups too
         :_entry_nodes: it stores information about which group nodes in main
-        tree should be called to update a group tree"""
+        tree should be called to update a group tree
+        :_nodes_to_update: cache of the nodes_to_update method"""
         self.is_updated = False
 
         self._group_nodes = defaultdict(set)
+        self._nodes_to_update: dict['GrTree', dict[NodeTree, set['GrNode']]] = dict()
 
     def __getitem__(self, gr_tree: 'GrTree') -> set['GrNode']:
         """It either returns related to given group tree Main tree or collection
         of group nodes to update given group tree"""
         if not self.is_updated:
             self._update()
-        return self._group_nodes[gr_tree]
+        # it should not add new keys to the defaultdict
+        return self._group_nodes.get(gr_tree, frozenset())
 
     def walk(self, gr_tree: 'GrTree') -> Iterator['GrNode']:
         """It expects a grop tree which was changed and returns iterator of
@@ -234,7 +229,7 @@ class TreesGraph:
         if not self.is_updated:
             self._update()
         visited = set()
-        to_visit = set(self._group_nodes[gr_tree])
+        to_visit = set(self._group_nodes.get(gr_tree, ()))
         for _ in range(1000):
             if not to_visit:
                 break
@@ -250,9 +245,24 @@ class TreesGraph:
         else:
             sv_logger.debug('Infinite walk detected')
 
+    def nodes_to_update(self, gr_tree: 'GrTree') -> dict[NodeTree, set['GrNode']]:
+        """Returns group nodes, grouped by their trees, which should be
+        updated to update given group tree. The result is cached till the
+        graph is changed because it's requested by each property event of
+        the group tree, e.g. many times per second during dragging a slider"""
+        if not self.is_updated:
+            self._update()
+        if gr_tree not in self._nodes_to_update:
+            nodes = defaultdict(set)
+            for gr_node in self.walk(gr_tree):
+                nodes[gr_node.id_data].add(gr_node)
+            self._nodes_to_update[gr_tree] = dict(nodes)
+        return self._nodes_to_update[gr_tree]
+
     def _update(self):
         """Calculate relationships between group trees and main trees"""
         self._group_nodes.clear()
+        self._nodes_to_update.clear()
         for tree in BlTrees().sv_main_trees:
             for gr_tree, gr_node in self._walk(tree):
                 self._group_nodes[gr_tree].add(gr_node)
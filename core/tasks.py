@@ -1,7 +1,7 @@
 import gc
-from time import time
-from functools import partial, cached_property, cache
-from typing import TYPE_CHECKING, Optional, Generator
+from time import perf_counter_ns
+from functools import partial, cached_property
+from typing import TYPE_CHECKING, Optional, Generator, Callable
 
 import bpy
 from sverchok.data_structure import post_load_call
@@ -21,52 +21,60 @@ class Tasks:
     2. Time the whole execution
     3. Display the progress in the UI
     """
-    _todo: set['Task']
+    _todo: dict[str, tuple['SvTree', Callable[['SvTree'], Generator], bool]]
     _current: Optional['Task']
 
     def __init__(self):
-        """:_todo: list of tasks to run
+        """:_todo: trees to update with their updaters, only one per tree
         :_current: task which was started to execute"""
-        self._todo = set()
+        self._todo = dict()
         self._current = None
 
     def __bool__(self):
         """Has anything to do?"""
         return bool(self._current or self._todo)
 
-    def add(self, task: 'Task'):
-        """Add new tasks to run them via timer"""
+    def add(self, tree: 'SvTree', updater: Callable[['SvTree'], Generator],
+            is_scene_update: bool = False):
+        """Add new tasks to run them via timer. If there is already a task
+        of the given tree in the queue the new one is ignored. The task is
+        created only when it's started
+        :updater: generator function which expects the tree to update"""
 
-        if task.is_scene_update:
+        if is_scene_update:
             # scene event can be excepted only as first event
             # in all other cases it can be generated by tree evaluation
             # and can lead to infinite loop of updates
             if self._current is not None:
                 return
 
-        # print(f"Add {task=}")
-        self._todo.add(task)
+        # print(f"Add {tree=}")
+        self._todo.setdefault(tree.tree_id, (tree, updater, is_scene_update))
 
     @profile(section="UPDATE")
     def run(self):
         """Run given tasks to update trees and report execution process in the
         header of a node tree editor"""
-        # 0.15 is max timer frequency
-        max_duration = 10 if self.current.is_scene_update else 0.15
+        # 0.15 is max timer frequency, durations are in nanoseconds
+        max_duration = 10_000_000_000 if self.current.is_scene_update else 150_000_000
         duration = 0
 
-        while self.current:
-            if duration > max_duration:
-                return
-            # print(f"Run task: {self.current}")
-            duration += self.current.run(max_duration-duration)
-            if self.current.last_node:
-                msg = f'Pres "ESC" to abort, updating node "{self.current.last_node.name}"'
-                self._report_progress(msg)
-            if self.current.is_exhausted:
-                self._next()
-
-        self._finish()
+        try:
+            while self.current:
+                if duration >= max_duration:
+                    return
+                # print(f"Run task: {self.current}")
+                duration += self.current.run(max_duration-duration)
+                if self.current.last_node:
+                    msg = f'Pres "ESC" to abort, updating node "{self.current.last_node.name}"'
+                    self._report_progress(msg)
+                if self.current.is_exhausted:
+                    self._next()
+
+            self._finish()
+        finally:
+            # the user can close editors between the timer calls
+            self._forget_areas()
 
     def cancel(self):
         """Remove all tasks in the queue and abort current one"""
@@ -87,7 +95,7 @@ class Tasks:
             return self._current
         elif self._todo:
             self._start()
-            self._current = self._todo.pop()
+            self._current = self._pop()
             return self._current
         else:
             return None
@@ -101,13 +109,20 @@ class Tasks:
         """Should be called to switch to next tasks when current is exhausted
         It made some cleanups after the previous task"""
         self._report_progress()
-        self._current = self._todo.pop() if self._todo else None
-        del self._main_area
+        self._current = self._pop()
+
+    def _pop(self) -> Optional['Task']:
+        """Creates task from the first tree in the queue and removes the tree
+        from the queue"""
+        if not self._todo:
+            return None
+        tree, updater, is_scene_update = self._todo.pop(next(iter(self._todo)))
+        return Task(tree, updater(tree), is_scene_update)
 
     def _finish(self):
         """Cleanups. Also triggers scene handler and mark trees to skip it"""
         self._report_progress()
-        del self._main_area
+        self._forget_areas()
 
         # this only need to trigger scene changes handler again
         # todo should be proved that this is right location to call from
@@ -119,19 +134,29 @@ class Tasks:
             t['SKIP_UPDATE'] = True
 
         gc.enable()
-        sv_logger.debug(f'Global update - {int((time() - self._start_time) * 1000)}ms')
+        sv_logger.debug(f'Global update - {(perf_counter_ns() - self._start_time) // 1_000_000}ms')
         del self._start_time
 
     @cached_property
     def _start_time(self):
-        """Start time of execution the whole queue of tasks"""
-        return time()
+        """Start time of execution the whole queue of tasks in nanoseconds"""
+        return perf_counter_ns()
 
-    @cached_property
+    @property
     def _main_area(self) -> Optional:
         """Searching appropriate area index for reporting update progress"""
         if not self.current:
             return
+        try:
+            return self._areas.get(self._current.tree.name)
+        except ReferenceError:
+            sv_logger.debug(f"Unable report a nodes updating progress")
+
+    @cached_property
+    def _areas(self) -> dict[str, bpy.types.Area]:
+        """Tree editors by names of trees opened in them. The search is done
+        once per timer call instead of once per task"""
+        areas = dict()
         for area in bpy.context.screen.areas:
             if area.ui_type == 'SverchCustomTreeType':
                 path = area.spaces[0].path
@@ -139,11 +164,16 @@ class Tasks:
                 # it appeared the tree already can be invalid when undo event
                 # is called pretty fast
                 try:
-                    if path and path[-1].node_tree.name == self._current.tree.name:
-                        return area
+                    if path:
+                        areas.setdefault(path[-1].node_tree.name, area)
                 except ReferenceError:
                     # probably all reports should be cleaned through search
                     sv_logger.debug(f"Unable report a nodes updating progress")
+        return areas
+
+    def _forget_areas(self):
+        """Should be called when the found areas can be outdated"""
+        self.__dict__.pop('_areas', None)  # can be not calculated yet
 
     def _report_progress(self, text: str = None):
         """Show text in the tree editor header. If text is none the header
@@ -170,9 +200,10 @@ tree_event_loop = partial(tree_event_loop, 0.01)
 
 
 class Task:
-    """Generator which should update some node tree. The task is hashable, and
-    it is equal to another task if booth of them update the same tree.
+    """Generator which should update some node tree.
     The generator is suspendable and can limit its execution by given time"""
+    __slots__ = ('tree', 'is_scene_update', 'is_exhausted', 'last_node', '_updater')
+
     def __init__(self, tree, updater, is_scene_update):
         """:tree: tree which should be updated
         :_updater: generator which should update given tree
@@ -185,23 +216,37 @@ class Task:
         self.last_node = None
 
         self._updater: Generator = updater
-        self.__hash__ = cache(self.__hash__)
 
-    def run(self, max_duration):
-        """Starts the tree updating
-        :max_duration: if updating of the tree takes more time than given
-        maximum duration it saves its state and returns execution flow"""
+    def run(self, max_duration: int) -> int:
+        """Starts the tree updating and returns execution time in nanoseconds
+        :max_duration: if updating of the tree takes more nanoseconds than
+        given maximum duration it saves its state and returns execution flow"""
         duration = 0
+        nodes_number = 0  # processed since the last clock check
+        skip_checks = 0  # number of nodes to process before next clock check
+        start_time = perf_counter_ns()
         try:
-            start_time = time()
             while duration < max_duration:
                 self.last_node = next(self._updater)
-                duration = time() - start_time
+                nodes_number += 1
+                if skip_checks:
+                    skip_checks -= 1
+                    continue
+                last_duration = duration
+                duration = perf_counter_ns() - start_time
+                # with fast nodes the clock is checked rarely, it's expected
+                # that skipped nodes take no more than 1/16 of the rest time.
+                # Only the last nodes are taken into account, so the first
+                # checked slow node after fast ones reduces the skipping
+                rest = max_duration - duration
+                interval = duration - last_duration
+                skip_checks = min(15, rest * nodes_number // (interval * 16 + 1))
+                nodes_number = 0
             return duration
 
         except StopIteration:
             self.is_exhausted = True
-            return duration
+            return perf_counter_ns() - start_time
 
     def throw(self, error: CancelError):
         """Should be used to cansel tree execution. Updater should add
@@ -209,12 +254,6 @@ class Task:
         self._updater.throw(error)
         self.is_exhausted = True
 
-    def __eq__(self, other: 'Task'):
-        return self.tree.tree_id == other.tree.tree_id
-
-    def __hash__(self):
-        return hash(self.tree.tree_id)
-
     def __repr__(self):
         return f"<Task: {self.tree.name}>"
 
@@ -227,6 +266,9 @@ def post_load_register():
     if not bpy.app.timers.is_registered(tree_event_loop):
         bpy.app.timers.register(tree_event_loop)
 
+    # the areas belong to the previous file
+    tasks._forget_areas()
+
 
 def register():
     """Registration of Sverchok event handler"""
@@ -1,7 +1,7 @@
 from collections import defaultdict
 from copy import copy
-from functools import lru_cache
-from graphlib import TopologicalSorter
+from functools import lru_cache, cached_property
+from graphlib import TopologicalSorter, CycleError
 from itertools import chain
 from time import perf_counter
 from typing import TYPE_CHECKING, Optional, Generator, Iterable
@@ -44,25 +44,25 @@ def control_center(event):
     elif type(event) is ev.SceneEvent:
         if event.tree.sv_scene_update and event.tree.sv_process:
             UpdateTree.get(event.tree).is_scene_updated = False
-            ts.tasks.add(ts.Task(event.tree,
-                                 UpdateTree.main_update(event.tree),
-                                 is_scene_update=True))
+            ts.tasks.add(event.tree,
+                         UpdateTree.main_update,
+                         is_scene_update=True)
 
     # nodes changed properties
     elif type(event) is ev.PropertyEvent:
         tree = UpdateTree.get(event.tree)
         tree.add_outdated(event.updated_nodes)
         if event.tree.sv_process:
-            ts.tasks.add(ts.Task(event.tree,
-                                 UpdateTree.main_update(event.tree),
-                                 is_scene_update=False))
+            ts.tasks.add(event.tree,
+                         UpdateTree.main_update,
+                         is_scene_update=False)
 
     # update the whole tree anyway
     elif type(event) is ev.ForceEvent:
         UpdateTree.reset_tree(event.tree)
-        ts.tasks.add(ts.Task(event.tree,
-                             UpdateTree.main_update(event.tree),
-                             is_scene_update=False))
+        ts.tasks.add(event.tree,
+                     UpdateTree.main_update,
+                     is_scene_update=False)
 
     # mark that the tree topology has changed
     # also this can be called (by Blender) during undo event in this case all
@@ -71,9 +71,9 @@ def control_center(event):
     elif type(event) is ev.TreeEvent:
         UpdateTree.get(event.tree).is_updated = False
         if event.tree.sv_process:
-            ts.tasks.add(ts.Task(event.tree,
-                                 UpdateTree.main_update(event.tree),
-                                 is_scene_update=False))
+            ts.tasks.add(event.tree,
+                         UpdateTree.main_update,
+                         is_scene_update=False)
 
     # new file opened
     elif type(event) is ev.FileEvent:
@@ -124,9 +124,9 @@ class SearchTree:
 
     def nodes_from(self, from_nodes: Iterable['SvNode']) -> set['SvNode']:
         """Returns all next nodes from given ones"""
+        # it's not a generator to not create one per each visited node
         def node_walker_to(node_: 'SvNode'):
-            for nn in self._to_nodes.get(node_, []):
-                yield nn
+            return self._to_nodes.get(node_, ())
 
         return set(bfs_walk(from_nodes, node_walker_to))
 
@@ -141,7 +141,7 @@ class SearchTree:
         The list will be empty if the socket is not connected.
         Connected input socket will always return list with one node"""
         if socket.is_output:
-            next_socks = self._to_socks.get(socket, [])
+            next_socks = self._to_socks.get(socket, ())
             return [self._sock_node[s] for s in next_socks]
         else:
             prev_sock = self._from_sock.get(socket)
@@ -149,9 +149,9 @@ class SearchTree:
 
     def nodes_to(self, to_nodes: Iterable['SvNode']) -> set['SvNode']:
         """Returns all previous nodes from given ones"""
+        # it's not a generator to not create one per each visited node
         def node_walker_from(node_: 'SvNode'):
-            for nn in self._from_nodes.get(node_, []):
-                yield nn
+            return self._from_nodes.get(node_, ())
 
         return set(bfs_walk(to_nodes, node_walker_from))
 
@@ -397,10 +397,11 @@ class UpdateTree(SearchTree):
         nodes. This can be expensive, so it should be called only before tree
         reevaluation
         """
-        if tree.tree_id not in cls._tree_catch:
+        tree_id = tree.tree_id  # it's a Python property reading RNA data
+        if tree_id not in cls._tree_catch:
             _tree = cls(tree)
         else:
-            _tree = cls._tree_catch[tree.tree_id]
+            _tree = cls._tree_catch[tree_id]
 
             if refresh_tree:
                 # update topology
@@ -478,8 +479,8 @@ class UpdateTree(SearchTree):
     @classmethod
     def reset_tree(cls, tree: NodeTree = None):
         """Remove tree data or data of all trees from the cache"""
-        if tree is not None and tree.tree_id in cls._tree_catch:
-            del cls._tree_catch[tree.tree_id]
+        if tree is not None and (tree_id := tree.tree_id) in cls._tree_catch:
+            del cls._tree_catch[tree_id]
 
             # reset nested trees too
             for group in (n for n in tree.nodes if hasattr(n, 'node_tree')):
@@ -495,13 +496,29 @@ class UpdateTree(SearchTree):
         copy_ = type(self)(new_tree)
         for attr in self._copy_attrs:
             setattr(copy_, attr, copy(getattr(self, attr)))
+
+        # the order of execution is the same if node connections were not
+        # changed (sockets were added or links were moved between sockets of
+        # the same nodes etc.), sorting also is the most expensive part here
+        if self._sorted_order is not None \
+                and copy_._from_nodes == self._from_nodes:
+            new_nodes = {n: n for n in copy_._from_nodes}  # old nodes can be invalid
+            copy_._sorted_order = [copy_._sorted_item(new_nodes[n])
+                                   for n, *_ in self._sorted_order]
         return copy_
 
     def add_outdated(self, nodes: Iterable):
         """Add outdated nodes explicitly. Animation and scene dependent nodes
         can be marked as outdated via dedicated flags for performance."""
         if self._outdated_nodes is not None:
-            self._outdated_nodes.update(nodes)
+            # nodes which are not in the tree structure (frames, reroutes,
+            # muted nodes) can't be walked, but if the topology is outdated
+            # they can be part of the new structure
+            if self.is_updated:
+                self._outdated_nodes.update(
+                    n for n in nodes if n in self._from_nodes)
+            else:
+                self._outdated_nodes.update(nodes)
 
     def __init__(self, tree: NodeTree):
         """Should not use be used directly, only via the get class method
@@ -512,6 +529,9 @@ class UpdateTree(SearchTree):
         updated
         :_outdated_nodes: Keeps nodes which properties were changed or which
         have errors. Can be None when what means that all nodes are outdated
+        :_sorted_order: cache of all nodes of the tree in order of their
+        execution. It's not copied as is because the copy is created only when
+        the tree topology was changed
         :_copy_attrs: list of attributes which should be copied by the copy
         method"""
         super().__init__(tree)
@@ -521,6 +541,7 @@ class UpdateTree(SearchTree):
         self.is_animation_updated = True
         self.is_scene_updated = True
         self._outdated_nodes: Optional[set[SvNode]] = None  # None means outdated all
+        self._sorted_order: Optional[list[tuple[SvNode, list[NodeSocket], tuple[SvNode, ...]]]] = None
 
         # https://stackoverflow.com/a/68550238
         self._sort_nodes = lru_cache(maxsize=1)(self.__sort_nodes)
@@ -536,7 +557,7 @@ class UpdateTree(SearchTree):
         """Returns nodes which are animation dependent"""
         an_nodes = set()
         if not self.is_animation_updated:
-            for node in self._tree.nodes:
+            for node in self._animation_dependent_nodes:
                 if getattr(node, 'is_animation_dependent', False) \
                         and getattr(node, 'is_animatable', False):
                     an_nodes.add(node)
@@ -546,12 +567,27 @@ class UpdateTree(SearchTree):
         """Returns nodes which are scene dependent"""
         sc_nodes = set()
         if not self.is_scene_updated:
-            for node in self._tree.nodes:
+            for node in self._scene_dependent_nodes:
                 if getattr(node, 'is_scene_dependent', False) \
                         and getattr(node, 'is_interactive', False):
                     sc_nodes.add(node)
         return sc_nodes
 
+    # The dependency is usually defined by class attribute, so most nodes can
+    # be filtered out once per tree topology. If it's a property of the class,
+    # its value can change any time and the node is kept for further checks.
+    @cached_property
+    def _animation_dependent_nodes(self) -> list['SvNode']:
+        """Nodes which can be animation dependent"""
+        return [n for n in self._tree.nodes
+                if getattr(type(n), 'is_animation_dependent', False)]
+
+    @cached_property
+    def _scene_dependent_nodes(self) -> list['SvNode']:
+        """Nodes which can be scene dependent"""
+        return [n for n in self._tree.nodes
+                if getattr(type(n), 'is_scene_dependent', False)]
+
     def _walk(self) -> tuple[Node, list[NodeSocket]]:
         """Yields nodes in order of their proper execution. It starts yielding
         from outdated nodes. It keeps the outdated_nodes storage in proper
@@ -566,14 +602,28 @@ class UpdateTree(SearchTree):
             self._outdated_nodes = set()
         # walk triggered nodes and error nodes from previous updates
         else:
+            # nothing to update, also it keeps the sorting cache intact
+            if not self._outdated_nodes:
+                return
             outdated = frozenset(self._outdated_nodes)
             self._outdated_nodes.clear()
 
-        for node, other_socks in self._sort_nodes(outdated):
+        yield from self._walk_sorted(self._sort_nodes(outdated))
+
+    def _walk_sorted(self, sorted_nodes: list[tuple['SvNode', list[NodeSocket], tuple['SvNode', ...]]])\
+            -> tuple[Node, list[NodeSocket]]:
+        """Yields given sorted nodes if their previous nodes are updated,
+        otherwise marks them as not updated. Nodes which were not updated
+        after yielding go into outdated_nodes. This part is common for main
+        and group trees, they differ only in which nodes should be walked"""
+        # statuses are always read from nodes because some nodes (loops,
+        # evolver) can update other nodes of the tree during the walk
+        for node, other_socks, prev_nodes in sorted_nodes:
             # execute node only if all previous nodes are updated
-            if all(n.get(UPDATE_KEY, True) for sock in other_socks if (n := self._sock_node.get(sock))):
+            if not prev_nodes or all(n.get(UPDATE_KEY, True) for n in prev_nodes):
                 yield node, other_socks
-                if node.get(ERROR_KEY, False):
+                # a node with an error is never updated
+                if not node.get(UPDATE_KEY, True):
                     self._outdated_nodes.add(node)
             else:
                 node[UPDATE_KEY] = False
@@ -581,7 +631,7 @@ class UpdateTree(SearchTree):
     def __sort_nodes(self,
                      from_nodes: frozenset['SvNode'] = None,
                      to_nodes: frozenset['SvNode'] = None)\
-                     -> list[tuple['SvNode', list[NodeSocket]]]:
+                     -> list[tuple['SvNode', list[NodeSocket], tuple['SvNode', ...]]]:
         """Sort nodes of the tree in proper execution order. When all given
         parameters are None it uses all tree nodes
         :from_nodes: if given it sorts only next nodes from given ones
@@ -589,9 +639,8 @@ class UpdateTree(SearchTree):
         If from_nodes and to_nodes are given it uses only intersection of next
         nodes from from_nodes and previous nodes from to_nodes"""
         nodes_to_walk = set()
-        walk_structure = None
         if from_nodes is None and to_nodes is None:
-            walk_structure = self._from_nodes
+            return self._get_sorted_order()
         elif from_nodes and to_nodes:
             from_ = self.nodes_from(from_nodes)
             to_ = self.nodes_to(to_nodes)
@@ -602,41 +651,59 @@ class UpdateTree(SearchTree):
             nodes_to_walk = self.nodes_to(from_nodes)
 
         if nodes_to_walk:
-            walk_structure: dict[SvNode, set[SvNode]] = defaultdict(set)
-            for n in nodes_to_walk:
-                if n in self._from_nodes:
-                    walk_structure[n] = {_n for _n in self._from_nodes[n]
-                                         if _n in nodes_to_walk}
-
-        nodes = []
-        if walk_structure:
-            for node in TopologicalSorter(walk_structure).static_order():
-                nodes.append((node, [self._from_sock.get(s) for s in node.inputs]))
-        return nodes
+            try:
+                # any subsequence of the sorted nodes is sorted too
+                return [item for item in self._get_sorted_order()
+                        if item[0] in nodes_to_walk]
+            except CycleError:
+                # the cycle can be outside of the nodes to walk
+                return [self._sorted_item(n)
+                        for n in self.sort_nodes(nodes_to_walk)]
+        return []
+
+    def _get_sorted_order(self) -> list[tuple['SvNode', list[NodeSocket], tuple['SvNode', ...]]]:
+        """Returns all nodes of the tree in order of their execution together
+        with output sockets connected to their inputs and with previous nodes.
+        The sorting is done only once per tree topology. Raises CycleError
+        if the tree has cyclic links, the result is not cached then"""
+        if self._sorted_order is None:
+            sorted_order = []
+            for node in TopologicalSorter(self._from_nodes).static_order():
+                sorted_order.append(self._sorted_item(node))
+            self._sorted_order = sorted_order
+        return self._sorted_order
+
+    def _sorted_item(self, node: 'SvNode') \
+            -> tuple['SvNode', list[NodeSocket], tuple['SvNode', ...]]:
+        """Returns given node in the format of the sorted order"""
+        return (node,
+                [self._from_sock.get(s) for s in node.inputs],
+                tuple(self._from_nodes[node]))
 
     def _update_difference(self, old: 'UpdateTree') -> set['SvNode']:
         """Returns nodes which should be updated according to changes in the
         tree topology
         :old: previous state of the tree to compare with"""
         nodes_to_update = self._from_nodes.keys() - old._from_nodes.keys()
-        new_links = self._links - old._links
-        for from_sock, to_sock in new_links:
-            if from_sock not in old._from_sock:  # socket was not connected
-                # protect from if not self.outputs[0].is_linked: return
-                nodes_to_update.add(self._sock_node[from_sock])
-            else:
+        # only one temporary set, it keeps both new and removed links
+        for link in self._links ^ old._links:
+            from_sock, to_sock = link
+            if link in self._links:  # new link
+                if from_sock not in old._from_sock:  # socket was not connected
+                    # protect from if not self.outputs[0].is_linked: return
+                    nodes_to_update.add(self._sock_node[from_sock])
+                else:
+                    nodes_to_update.add(self._sock_node[to_sock])
+            else:  # removed link
+                if to_sock not in self._sock_node:
+                    continue  # the link was removed together with the node
                 nodes_to_update.add(self._sock_node[to_sock])
-        removed_links = old._links - self._links
-        for from_sock, to_sock in removed_links:
-            if to_sock not in self._sock_node:
-                continue  # the link was removed together with the node
-            nodes_to_update.add(self._sock_node[to_sock])
         return nodes_to_update
 
     def _calc_cam_update_time(self) -> Iterable['SvNode']:
         """Return cumulative update time in order of node_group.nodes collection"""
         cum_time_nodes = dict()  # don't have frame nodes
-        for node, prev_socks in self.__sort_nodes():
+        for node, *_ in self.__sort_nodes():
             prev_nodes = self._from_nodes[node]
             if len(prev_nodes) > 1:
                 cum_time = sum(n.get(TIME_KEY, 0) for n in self.nodes_to([node]))
@@ -792,8 +792,12 @@ class SverchCustomTreeNode(UpdateNodes, NodeUtils, NodeDependencies, NodeDocumen
             if 'user_color' not in self:
                 self['use_user_color'] = self.use_custom_color
                 self['user_color'] = self.color
-            self.use_custom_color = True
-            self.color = color
+            # the method is called on each update, and writing is expensive
+            # because it triggers redrawing of the tree editor
+            if not self.use_custom_color:
+                self.use_custom_color = True
+            if self.color[:] != color[:]:
+                self.color = color
 
     def rclick_menu(self, context, layout):
         """
@@ -0,0 +1,68 @@
+from time import sleep
+from types import SimpleNamespace
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.tasks import Tasks, Task
+
+
+def _updater(nodes_number, delay=0.0):
+    """Fake tree updater, each yielded integer imitates a node"""
+    for i in range(nodes_number):
+        if delay:
+            sleep(delay)
+        yield i
+
+
+def _fast_slow_updater(fast_number, slow_number, delay):
+    """Fake tree updater with instant nodes followed by slow ones"""
+    yield from _updater(fast_number)
+    yield from _updater(slow_number, delay)
+
+
+class TaskTest(SverchokTestCase):
+    def test_task_budget(self):
+        tree = SimpleNamespace(name="Tree", tree_id="tree")
+        delay = 0.01  # seconds per node
+        max_duration = 50_000_000  # nanoseconds
+        task = Task(tree, _updater(100, delay), False)
+        duration = task.run(max_duration)
+
+        self.assertFalse(task.is_exhausted)
+        self.assertGreaterEqual(duration, max_duration)
+        # only one node can be processed after the budget is over
+        self.assertLess(duration, max_duration + 5 * delay * 1_000_000_000)
+        self.assertLess(task.last_node, 10)
+
+    def test_task_budget_after_fast_nodes(self):
+        tree = SimpleNamespace(name="Tree", tree_id="tree")
+        delay = 0.01  # seconds per slow node
+        max_duration = 50_000_000  # nanoseconds
+        task = Task(tree, _fast_slow_updater(32, 100, delay), False)
+        duration = task.run(max_duration)
+
+        self.assertFalse(task.is_exhausted)
+        self.assertGreaterEqual(duration, max_duration)
+        # the skipped checks after fast nodes should not exceed the budget much
+        self.assertLess(duration, max_duration + 3 * delay * 1_000_000_000)
+
+    def test_task_exhausted(self):
+        tree = SimpleNamespace(name="Tree", tree_id="tree")
+        task = Task(tree, _updater(3, 0.001), False)
+        duration = task.run(10_000_000_000)
+
+        self.assertTrue(task.is_exhausted)
+        self.assertEqual(task.last_node, 2)
+        self.assertGreater(duration, 0)
+        self.assertLess(duration, 10_000_000_000)
+
+    def test_tasks_deduplication(self):
+        tree = SimpleNamespace(name="Tree", tree_id="tree")
+        first, second = lambda t: _updater(1), lambda t: _updater(2)
+        tasks = Tasks()
+        tasks.add(tree, first)
+        tasks.add(tree, second, is_scene_update=True)
+
+        self.assertEqual(len(tasks._todo), 1)
+        _, updater, is_scene_update = tasks._todo[tree.tree_id]
+        self.assertIs(updater, first)
+        self.assertFalse(is_scene_update)
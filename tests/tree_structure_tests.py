@@ -46,6 +46,7 @@ class TreeStructureTest(SverchokTestCase):
                     socket: ts.Socket = node.inputs[s_i]
                     self.assertEqual(socket.is_output, False)
                     self.assertEqual(bl_socket.identifier, socket.identifier)
+                    self.assertIs(node.get_input_socket(bl_socket.identifier), socket)
                     self.assertIs(node, socket.node)
                     self.assertEqual(socket.index, s_i)
                     self.assertEqual(bl_socket.identifier, socket.get_bl_socket(bl_tree).identifier)
@@ -54,6 +55,7 @@ class TreeStructureTest(SverchokTestCase):
                     socket: ts.Socket = node.outputs[s_i]
                     self.assertEqual(socket.is_output, True)
                     self.assertEqual(bl_socket.identifier, socket.identifier)
+                    self.assertIs(node.get_output_socket(bl_socket.identifier), socket)
                     self.assertIs(node, socket.node)
                     self.assertEqual(socket.index, s_i)
                     self.assertEqual(bl_socket.identifier, socket.get_bl_socket(bl_tree).identifier)
@@ -1,7 +1,8 @@
+from graphlib import CycleError
 from typing import Iterable
 
 from sverchok.utils.testing import SverchokTestCase
-from sverchok.core.update_system import SearchTree
+from sverchok.core.update_system import SearchTree, UpdateTree
 
 
 class TreeCleaningTest(SverchokTestCase):
@@ -76,6 +77,91 @@ class TreeCleaningTest(SverchokTestCase):
         self.assertSetEqual(f_ns, t_ns, msg=msg)
 
 
+class SortedOrderTest(SverchokTestCase):
+    def test_partial_walk(self):
+        with self.temporary_node_tree("SortingTree") as tree:
+            n1, n2, math, out = self._create_nodes(tree)
+            up_tree = UpdateTree.get(tree)
+            try:
+                for node in (n1, n2, math, out):
+                    with self.subTest(msg=f'Walk from "{node.name}" node'):
+                        sorted_nodes = up_tree._sort_nodes(frozenset({node}))
+                        self.assertSetEqual({n for n, *_ in sorted_nodes},
+                                            up_tree.nodes_from([node]))
+                        self._assert_order(up_tree, sorted_nodes)
+            finally:
+                UpdateTree.reset_tree(tree)
+
+    def test_copy_sorted_order(self):
+        with self.temporary_node_tree("SortingTree") as tree:
+            n1, n2, math, out = self._create_nodes(tree)
+            up_tree = UpdateTree.get(tree)
+            try:
+                order = [n for n, *_ in up_tree._sort_nodes()]
+
+                with self.subTest(msg="Copy of unchanged tree"):
+                    copy_ = up_tree.copy(tree)
+                    self.assertIsNotNone(copy_._sorted_order)
+                    self.assertListEqual([n for n, *_ in copy_._sort_nodes()], order)
+
+                with self.subTest(msg="Copy of relinked tree"):
+                    tree.links.remove(out.inputs[0].links[0])
+                    tree.links.new(n1.outputs[0], out.inputs[0])
+                    copy_ = up_tree.copy(tree)
+                    self.assertIsNone(copy_._sorted_order)
+                    sorted_nodes = copy_._sort_nodes()
+                    self.assertSetEqual({n for n, *_ in sorted_nodes},
+                                        {n1, n2, math, out})
+                    self._assert_order(copy_, sorted_nodes)
+                    self.assertSetEqual(set(copy_._from_nodes[out]), {n1})
+            finally:
+                UpdateTree.reset_tree(tree)
+
+    def test_cyclic_links(self):
+        with self.temporary_node_tree("SortingTree") as tree:
+            n1, n2, math, out = self._create_nodes(tree)
+            cycle1 = tree.nodes.new('SvScalarMathNodeMK4')
+            cycle2 = tree.nodes.new('SvScalarMathNodeMK4')
+            tree.links.new(cycle1.outputs[0], cycle2.inputs[0])
+            tree.links.new(cycle2.outputs[0], cycle1.inputs[0])
+            up_tree = UpdateTree.get(tree)
+            try:
+                with self.subTest(msg="Sorting of all nodes"):
+                    for _ in range(2):  # the failed sorting is not cached
+                        self.assertRaises(CycleError, up_tree._sort_nodes)
+                        self.assertIsNone(up_tree._sorted_order)
+
+                with self.subTest(msg="Walk from nodes without the cycle"):
+                    sorted_nodes = up_tree._sort_nodes(frozenset({n2}))
+                    self.assertSetEqual({n for n, *_ in sorted_nodes},
+                                        {n2, math, out})
+                    self._assert_order(up_tree, sorted_nodes)
+            finally:
+                UpdateTree.reset_tree(tree)
+
+    def _create_nodes(self, tree):
+        tree.sv_process = False
+        n1 = tree.nodes.new('SvNumberNode')
+        n2 = tree.nodes.new('SvNumberNode')
+        math = tree.nodes.new('SvScalarMathNodeMK4')
+        out = tree.nodes.new('SvStethoscopeNodeMK2')
+        tree.links.new(n1.outputs[0], math.inputs[0])
+        tree.links.new(n2.outputs[0], math.inputs[1])
+        tree.links.new(math.outputs[0], out.inputs[0])
+        return n1, n2, math, out
+
+    def _assert_order(self, up_tree, sorted_nodes):
+        to_walk = {n for n, *_ in sorted_nodes}
+        walked = set()
+        for node, _, prev_nodes in sorted_nodes:
+            self.assertSetEqual(set(prev_nodes), set(up_tree._from_nodes[node]))
+            for prev in prev_nodes:
+                if prev in to_walk:
+                    self.assertIn(prev, walked,
+                                  msg=f'"{prev.name}" should be before "{node.name}"')
+            walked.add(node)
+
+
 def _to_names(nodes: Iterable) -> Iterable[str]:
     for n in nodes:
         yield n.name
@@ -32,6 +32,7 @@ from sverchok.utils.sv_logging import sv_logger
 
 callback_dict = {}
 point_dict = {}
+text_dict = {}  # arguments of drawn texts
 
 
 def tag_redraw_all_nodeviews():
@@ -59,17 +60,21 @@ def draw_text(node, text: str, draw_id=None, color=(1, 1, 1, 1), scale=1., align
     """Draw any text nearby a node, use together with callback_disable
     align = {"RIGHT", "UP", "DOWN"} todo replace with typing.Literal"""
     draw_id = draw_id or node.node_id
+    color = tuple(color) if len(color) == 4 else (*color, 1)
+    text_location = None if dynamic_location else _get_text_location(node, align)
+    args = (node.id_data.tree_id, node.node_id, text, color, scale, align, text_location)
+
+    # the function is called by update system for every node on each update
+    # and redrawing of all node editors is expensive
     if draw_id in callback_dict:
+        if text_dict.get(draw_id) == args:
+            return
         callback_disable(draw_id)
 
-    color = color if len(color) == 4 else (*color, 1)
-    text_location = None if dynamic_location else _get_text_location(node, align)
     handle_pixel = SpaceNodeEditor.draw_handler_add(
-        _draw_text_handler,
-        (node.id_data.tree_id, node.node_id, text, color, scale, align, text_location),
-        'WINDOW',
-        'POST_VIEW')
+        _draw_text_handler, args, 'WINDOW', 'POST_VIEW')
     callback_dict[draw_id] = handle_pixel
+    text_dict[draw_id] = args
     tag_redraw_all_nodeviews()
 
 
@@ -80,6 +85,7 @@ def callback_disable(n_id):
         return
     SpaceNodeEditor.draw_handler_remove(handle_pixel, 'WINDOW')
     del callback_dict[n_id]
+    text_dict.pop(n_id, None)
     tag_redraw_all_nodeviews()
 
 
@@ -27,6 +27,8 @@ class Node(tw.Node):
 
         self._inputs: List[Socket] = []
         self._outputs: List[Socket] = []
+        self._inputs_by_id: Dict[str, Socket] = dict()
+        self._outputs_by_id: Dict[str, Socket] = dict()
         self._index = index
         self._tree = tree
 
@@ -74,28 +76,32 @@ class Node(tw.Node):
 
     def get_input_socket(self, identifier: str, default=None) -> Optional[Socket]:
         """Search input socket by its identifier"""
-        for socket in self._inputs:
-            if socket.identifier == identifier:
-                return socket
-        return default
+        return self._inputs_by_id.get(identifier, default)
 
     def get_output_socket(self, identifier: str, default=None) -> Optional[Socket]:
         """Search output socket by its identifier"""
-        for socket in self._outputs:
-            if socket.identifier == identifier:
-                return socket
-        return default
+        return self._outputs_by_id.get(identifier, default)
 
     @classmethod
     def from_bl_node(cls, bl_node: bpy.types.Node, index: int, tree: Tree) -> Node:
         """Generate node and its sockets from Blender node instance"""
         node = cls(bl_node.name, index, tree, bl_node)
         for in_socket in bl_node.inputs:
-            node.inputs.append(Socket.from_bl_socket(node, in_socket))
+            node._add_socket(Socket.from_bl_socket(node, in_socket))
         for out_socket in bl_node.outputs:
-            node.outputs.append(Socket.from_bl_socket(node, out_socket))
+            node._add_socket(Socket.from_bl_socket(node, out_socket))
         return node
 
+    def _add_socket(self, socket: Socket):
+        """Append the socket to the node, the first socket with given
+        identifier is found by the identifier"""
+        if socket.is_output:
+            self._outputs.append(socket)
+            self._outputs_by_id.setdefault(socket.identifier, socket)
+        else:
+            self._inputs.append(socket)
+            self._inputs_by_id.setdefault(socket.identifier, socket)
+
     def __repr__(self):
         return f'Node:"{self.name}"'
 
@@ -151,7 +157,7 @@ class Tree(tw.Tree[NodeType]):
         for node in self._nodes:
             if node.bl_tween.bl_idname == 'WifiInNode' and node.bl_tween.var_name:
                 socket = Socket(node, True, "Virtual wifi socket")
-                node.outputs.append(socket)
+                node._add_socket(socket)
                 var_name_wifi_in[node.bl_tween.var_name] = node
 
         # add sockets to wifi "to nodes" and connect them to wifi "from nodes" if there is wifi node with such variable
@@ -159,7 +165,7 @@ class Tree(tw.Tree[NodeType]):
             for to_node in self._nodes:
                 if to_node.bl_tween.bl_idname == 'WifiOutNode' and to_node.bl_tween.var_name in var_name_wifi_in:
                     socket = Socket(to_node, False, "Virtual wifi socket")
-                    to_node.inputs.append(socket)
+                    to_node._add_socket(socket)
                     from_node = var_name_wifi_in[to_node.bl_tween.var_name]
                     from_socket = from_node.outputs[0]
                     to_socket = to_node.inputs[0]